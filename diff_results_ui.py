@@ -10,8 +10,27 @@ import os
 import sqlite3
 import sys
 from datetime import datetime
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
+# orjson (optional) encodes several times faster than the stdlib json
+# module; the JSON exporters fall back to json when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyarrow (optional) enables a columnar Parquet export; the button is
+# only shown when it is installed
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
 try:
     from PySide6.QtCore import (
         QAbstractTableModel,
@@ -19,13 +38,12 @@ try:
         QSortFilterProxyModel,
         Qt,
         QThread,
+        QTimer,
         Signal,
     )
     from PySide6.QtGui import (
         QColor,
         QFont,
-        QStandardItem,
-        QStandardItemModel,
         QSyntaxHighlighter,
         QTextCharFormat,
     )
@@ -46,8 +64,7 @@ try:
         QPushButton,
         QScrollBar,
         QSplitter,
-        QTableWidget,
-        QTableWidgetItem,
+        QTableView,
         QTabWidget,
         QTextEdit,
         QVBoxLayout,
@@ -62,13 +79,12 @@ except ImportError:
             QSortFilterProxyModel,
             Qt,
             QThread,
+            QTimer,
         )
         from PySide2.QtCore import pyqtSignal as Signal
         from PySide2.QtGui import (
             QColor,
             QFont,
-            QStandardItem,
-            QStandardItemModel,
             QSyntaxHighlighter,
             QTextCharFormat,
         )
@@ -89,8 +105,7 @@ except ImportError:
             QPushButton,
             QScrollBar,
             QSplitter,
-            QTableWidget,
-            QTableWidgetItem,
+            QTableView,
             QTabWidget,
             QTextEdit,
             QVBoxLayout,
@@ -101,6 +116,126 @@ except ImportError:
         raise ImportError("Neither PySide6 nor PySide2 is available. Please install one of them.")
 
 
+# Translate table for the whitespace pass after html.escape: non-breaking
+# spaces render identically to &nbsp; entities but need no further escaping
+_WS_TABLE = str.maketrans({' ': '\xa0', '\t': '\xa0\xa0\xa0\xa0'})
+
+# Precompiled %-templates for the diff panes. The %-operator substitutes
+# into a constant string in a single C call, avoiding per-line f-string
+# construction in the render loops.
+_LINE_EQUAL = '<span style="color: #858585; user-select: none;">%4d</span>&nbsp;&nbsp;%s'
+_DIV_EQUAL_RUN = '<div style="background-color: #1e1e1e;">%s</div>'
+_DIV_REMOVED = '<div style="background-color: #4a1f1f; color: #ff6b6b;"><span style="color: #ff9999; user-select: none;">%4d</span>&nbsp;&nbsp;%s</div>'
+_DIV_ADDED = '<div style="background-color: #1f4a1f; color: #6bff6b;"><span style="color: #99ff99; user-select: none;">%4d</span>&nbsp;&nbsp;%s</div>'
+_DIV_FILLER = ('<div style="background-color: #2a2a2a; color: #666;">'
+               '<span style="color: #555; user-select: none;">&nbsp;&nbsp;&nbsp;&nbsp;</span>&nbsp;&nbsp;'
+               + '&nbsp;' * 50 + '</div>')
+
+# Unified diff line templates, keyed by line prefix semantics
+_UDIFF_FILE = '<div style="background-color: #2a2a2a; color: #888; font-weight: bold;">%s</div>'
+_UDIFF_ADDED = '<div style="background-color: #1f4a1f; color: #6bff6b;">%s</div>'
+_UDIFF_REMOVED = '<div style="background-color: #4a1f1f; color: #ff6b6b;">%s</div>'
+_UDIFF_HUNK = '<div style="background-color: #1f1f4a; color: #6b6bff; font-weight: bold;">%s</div>'
+_UDIFF_CONTEXT = '<div style="background-color: #1e1e1e; color: #d4d4d4;">%s</div>'
+
+_PRE_WRAP = '<pre style="font-family: Courier; font-size: 18pt; margin: 0; padding: 0;">%s</pre>'
+
+# Exception types the export worker reports through its error signal;
+# pyarrow's hierarchy only exists when the optional import succeeded
+_EXPORT_ERRORS = (OSError, sqlite3.Error, ValueError, TypeError)
+if pa is not None:
+    _EXPORT_ERRORS = _EXPORT_ERRORS + (pa.ArrowException,)
+
+
+def _drop_file_cache(f):
+    """Flush a written export file and release its page-cache pages.
+
+    Export files are write-once; without this their pages linger in the
+    page cache and can evict Binary Ninja's hot analysis data. No-op on
+    platforms without posix_fadvise (macOS, Windows).
+    """
+    f.flush()
+    if hasattr(os, 'posix_fadvise'):
+        os.fsync(f.fileno())
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+# Rows per SQLite export transaction; large enough to amortize commit
+# overhead, small enough that each transaction fits in the page cache
+# instead of bloating the WAL on very large result sets
+_SQLITE_BATCH_SIZE = 20000
+
+# SQLite export insert, kept at module scope so every executemany call
+# binds against the same statement text and hits sqlite3's statement cache
+_INSERT_MATCH_SQL = (
+    "INSERT INTO function_matches "
+    "(function_a_name, function_a_address, function_b_name, function_b_address, "
+    "similarity, confidence, match_type, size_a, size_b, bb_count_a, bb_count_b, "
+    "instr_count_a, instr_count_b) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Static report skeleton; only the generated time and summary fields are
+# substituted per export
+_HTML_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Binary Diff Results</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background-color: #f0f0f0; padding: 20px; margin-bottom: 20px; }
+        .summary { background-color: #e8f4f8; padding: 15px; margin-bottom: 20px; }
+        table { border-collapse: collapse; width: 100%%; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #4CAF50; color: white; }
+        tr:nth-child(even) { background-color: #f2f2f2; }
+        .high-confidence { background-color: #90EE90; color: #006400; }
+        .medium-confidence { background-color: #FFD700; color: #8B4513; }
+        .low-confidence { background-color: #FFB6C1; color: #8B0000; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>Binary Diff Results</h1>
+        <p>Generated: %s</p>
+    </div>
+
+    <div class="summary">
+        <h2>Summary</h2>
+        <p><strong>Binary A:</strong> %s</p>
+        <p><strong>Binary B:</strong> %s</p>
+        <p><strong>Total Matches:</strong> %d</p>
+        <p><strong>Analysis Time:</strong> %.2f seconds</p>
+    </div>
+
+    <table>
+        <tr>
+            <th>Function A</th>
+            <th>Address A</th>
+            <th>Function B</th>
+            <th>Address B</th>
+            <th>Similarity</th>
+            <th>Confidence</th>
+            <th>Match Type</th>
+        </tr>
+        """
+
+_HTML_FOOT = """
+    </table>
+</body>
+</html>
+        """
+
+# One report row; filled per result by generate_html_table_rows
+_HTML_ROW = (
+    '<tr class="%s">'
+    '<td>%s</td><td>%s</td><td>%s</td><td>%s</td>'
+    '<td>%s</td><td>%s</td><td>%s</td>'
+    '</tr>\n'
+)
+
+
 class SideBySideDiffWidget(QWidget):
     """Widget for displaying side-by-side diff of two functions"""
 
@@ -110,6 +245,16 @@ class SideBySideDiffWidget(QWidget):
         self.binary_view_b = None
         self.current_function_a = None
         self.current_function_b = None
+        # Resolved Binary Ninja Function objects for the current pair,
+        # cached to avoid a get_function_at FFI round-trip per view update
+        self._func_a = None
+        self._func_b = None
+        # Guards the scroll-sync handlers against re-entering each other
+        self._syncing_scroll = False
+        # Rendered text keyed by (view id, address, view mode): toggling
+        # between view modes or exporting the current diff reuses earlier
+        # IL lifting instead of redoing it
+        self._text_cache = {}
         self.setup_ui()
 
     def setup_ui(self):
@@ -157,9 +302,16 @@ class SideBySideDiffWidget(QWidget):
         view_mode_layout = QHBoxLayout()
         view_mode_layout.addWidget(QLabel("View Mode:"))
 
+        # Debounce timer so rapid mode cycling (or programmatic changes)
+        # triggers a single disassembly+diff render instead of one per change
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(150)
+        self._update_timer.timeout.connect(self.update_view)
+
         self.view_mode_combo = QComboBox()
         self.view_mode_combo.addItems(["Disassembly", "Low Level IL", "Medium Level IL", "High Level IL", "Pseudo-C"])
-        self.view_mode_combo.currentTextChanged.connect(self.update_view)
+        self.view_mode_combo.currentTextChanged.connect(self._schedule_update)
         view_mode_layout.addWidget(self.view_mode_combo)
 
         view_mode_layout.addStretch()
@@ -168,7 +320,7 @@ class SideBySideDiffWidget(QWidget):
         view_mode_layout.addWidget(QLabel("Diff Mode:"))
         self.diff_mode_combo = QComboBox()
         self.diff_mode_combo.addItems(["Side-by-Side", "Unified Diff"])
-        self.diff_mode_combo.currentTextChanged.connect(self.update_view)
+        self.diff_mode_combo.currentTextChanged.connect(self._schedule_update)
         view_mode_layout.addWidget(self.diff_mode_combo)
 
         # Reset horizontal layout button
@@ -219,6 +371,7 @@ class SideBySideDiffWidget(QWidget):
             }
         """)
         self.text_a.setMinimumWidth(200)  # Prevent complete collapse
+        self._strip_text_edit_features(self.text_a)
         self.splitter.addWidget(self.text_a)
 
         # Right side - Binary B
@@ -234,6 +387,7 @@ class SideBySideDiffWidget(QWidget):
             }
         """)
         self.text_b.setMinimumWidth(200)  # Prevent complete collapse
+        self._strip_text_edit_features(self.text_b)
         self.splitter.addWidget(self.text_b)
 
         # Set equal split initially
@@ -261,21 +415,45 @@ class SideBySideDiffWidget(QWidget):
         # Synchronize scrolling between the two text views
         self.text_a.verticalScrollBar().valueChanged.connect(self._sync_scroll_a_to_b)
         self.text_b.verticalScrollBar().valueChanged.connect(self._sync_scroll_b_to_a)
-        self._sync_in_progress = False
+
+    @staticmethod
+    def _strip_text_edit_features(text_edit):
+        """Disable QTextEdit machinery the read-only diff panes never use"""
+        # The panes are populated via setHtml only; pasted rich text, the
+        # undo stack, and the edit context menu just add per-update cost
+        text_edit.setAcceptRichText(False)
+        text_edit.setUndoRedoEnabled(False)
+        text_edit.setContextMenuPolicy(Qt.NoContextMenu)
+        text_edit.document().setUndoRedoEnabled(False)
+        text_edit.document().setDocumentMargin(0)
+
+    def _schedule_update(self, *_):
+        """Restart the debounce timer; only the last mode change renders"""
+        self._update_timer.start()
 
     def _sync_scroll_a_to_b(self, value):
         """Synchronize scroll from A to B"""
-        if not self._sync_in_progress:
-            self._sync_in_progress = True
+        # Re-entrancy flag rather than QSignalBlocker: the scroll area
+        # itself listens to the scrollbar's valueChanged to move its
+        # viewport, so blocking all signals would move the thumb without
+        # scrolling the mirrored pane's content
+        if self._syncing_scroll:
+            return
+        self._syncing_scroll = True
+        try:
             self.text_b.verticalScrollBar().setValue(value)
-            self._sync_in_progress = False
+        finally:
+            self._syncing_scroll = False
 
     def _sync_scroll_b_to_a(self, value):
         """Synchronize scroll from B to A"""
-        if not self._sync_in_progress:
-            self._sync_in_progress = True
+        if self._syncing_scroll:
+            return
+        self._syncing_scroll = True
+        try:
             self.text_a.verticalScrollBar().setValue(value)
-            self._sync_in_progress = False
+        finally:
+            self._syncing_scroll = False
 
     def reset_horizontal_layout(self):
         """Reset the horizontal splitter to 50/50 layout"""
@@ -293,12 +471,23 @@ class SideBySideDiffWidget(QWidget):
         """Set the binary views for both sides"""
         self.binary_view_a = binary_view_a
         self.binary_view_b = binary_view_b
+        self._func_a = None
+        self._func_b = None
+        self._text_cache.clear()
 
     def load_function_pair(self, func_a_info, func_b_info):
         """Load a pair of functions for side-by-side comparison"""
         self.current_function_a = func_a_info
         self.current_function_b = func_b_info
 
+        # Resolve the Function objects once; view-mode toggles reuse them
+        try:
+            self._func_a = self.binary_view_a.get_function_at(func_a_info.get('address', 0)) if self.binary_view_a else None
+            self._func_b = self.binary_view_b.get_function_at(func_b_info.get('address', 0)) if self.binary_view_b else None
+        except Exception:
+            self._func_a = None
+            self._func_b = None
+
         # Update headers
         self.label_a.setText(f"Binary A - {func_a_info.get('name', 'Unknown')} @ 0x{func_a_info.get('address', 0):x}")
         self.label_b.setText(f"Binary B - {func_b_info.get('name', 'Unknown')} @ 0x{func_b_info.get('address', 0):x}")
@@ -315,43 +504,57 @@ class SideBySideDiffWidget(QWidget):
         diff_mode = self.diff_mode_combo.currentText()
 
         # Get the text content for both functions
-        text_a = self._get_function_text(self.current_function_a, view_mode, self.binary_view_a)
-        text_b = self._get_function_text(self.current_function_b, view_mode, self.binary_view_b)
+        text_a = self._get_function_text(self.current_function_a, view_mode, self.binary_view_a, self._func_a)
+        text_b = self._get_function_text(self.current_function_b, view_mode, self.binary_view_b, self._func_b)
 
         if diff_mode == "Side-by-Side":
             self._show_side_by_side(text_a, text_b)
         else:
             self._show_unified_diff(text_a, text_b)
 
-    def _get_function_text(self, func_info, view_mode, binary_view):
+    def _get_function_text(self, func_info, view_mode, binary_view, func=None):
         """Get the text representation of a function based on view mode"""
         if not binary_view:
             return f"Binary view not available\nFunction: {func_info.get('name', 'Unknown')}\nAddress: 0x{func_info.get('address', 0):x}"
 
         try:
             address = func_info.get('address', 0)
-            func = binary_view.get_function_at(address)
+
+            # Rendering walks every instruction (and lifts IL for the IL
+            # modes), so serve repeats from the cache; keyed by view too
+            # since addresses can collide between the two binaries
+            cache_key = (id(binary_view), address, view_mode)
+            text = self._text_cache.get(cache_key)
+            if text is not None:
+                return text
+
+            if func is None:
+                # Fallback for callers without a pre-resolved Function
+                func = binary_view.get_function_at(address)
 
             if not func:
                 return f"Function not found at address 0x{address:x}"
 
             if "Disassembly" in view_mode:
                 # Get disassembly
-                return self._get_disassembly_text(func)
+                text = self._get_disassembly_text(func)
             elif "Low Level IL" in view_mode:
                 # Get Low-Level IL
-                return self._get_llil_text(func)
+                text = self._get_llil_text(func)
             elif "Medium Level IL" in view_mode:
                 # Get Medium-Level IL
-                return self._get_mlil_text(func)
+                text = self._get_mlil_text(func)
             elif "High Level IL" in view_mode:
                 # Get High-Level IL
-                return self._get_hlil_text(func)
+                text = self._get_hlil_text(func)
             elif "Pseudo-C" in view_mode:
                 # Get Pseudo-C representation
-                return self._get_pseudo_c_text(func)
+                text = self._get_pseudo_c_text(func)
             else:
-                return str(func)
+                text = str(func)
+
+            self._text_cache[cache_key] = text
+            return text
 
         except Exception as e:
             return f"Error getting function text: {str(e)}"
@@ -513,43 +716,50 @@ class SideBySideDiffWidget(QWidget):
         html_b = []
         line_num_a = 1
         line_num_b = 1
+        esc = self._escape_html
 
         for tag, i1, i2, j1, j2 in matcher.get_opcodes():
             if tag == 'equal':
-                # Lines are the same
-                for i in range(i1, i2):
-                    html_a.append(f'<div style="background-color: #1e1e1e;"><span style="color: #858585; user-select: none;">{line_num_a:4d}</span>&nbsp;&nbsp;{self._escape_html(lines_a[i])}</div>')
-                    line_num_a += 1
-                for j in range(j1, j2):
-                    html_b.append(f'<div style="background-color: #1e1e1e;"><span style="color: #858585; user-select: none;">{line_num_b:4d}</span>&nbsp;&nbsp;{self._escape_html(lines_b[j])}</div>')
-                    line_num_b += 1
+                # Lines are the same - emit the whole run as a single block.
+                # Newlines inside the enclosing <pre> break lines just like
+                # per-line divs, so this drops the div count from one per
+                # line to one per opcode group.
+                count = i2 - i1
+                chunk_a = '\n'.join(
+                    _LINE_EQUAL % (line_num_a + k, esc(lines_a[i1 + k])) for k in range(count)
+                )
+                html_a.append(_DIV_EQUAL_RUN % chunk_a)
+                line_num_a += count
+                chunk_b = '\n'.join(
+                    _LINE_EQUAL % (line_num_b + k, esc(lines_b[j1 + k])) for k in range(count)
+                )
+                html_b.append(_DIV_EQUAL_RUN % chunk_b)
+                line_num_b += count
             elif tag == 'replace':
                 # Lines are different
                 for i in range(i1, i2):
-                    html_a.append(f'<div style="background-color: #4a1f1f; color: #ff6b6b;"><span style="color: #ff9999; user-select: none;">{line_num_a:4d}</span>&nbsp;&nbsp;{self._escape_html(lines_a[i])}</div>')
+                    html_a.append(_DIV_REMOVED % (line_num_a, esc(lines_a[i])))
                     line_num_a += 1
                 for j in range(j1, j2):
-                    html_b.append(f'<div style="background-color: #1f4a1f; color: #6bff6b;"><span style="color: #99ff99; user-select: none;">{line_num_b:4d}</span>&nbsp;&nbsp;{self._escape_html(lines_b[j])}</div>')
+                    html_b.append(_DIV_ADDED % (line_num_b, esc(lines_b[j])))
                     line_num_b += 1
             elif tag == 'delete':
                 # Line only in A
                 for i in range(i1, i2):
-                    html_a.append(f'<div style="background-color: #4a1f1f; color: #ff6b6b;"><span style="color: #ff9999; user-select: none;">{line_num_a:4d}</span>&nbsp;&nbsp;{self._escape_html(lines_a[i])}</div>')
+                    html_a.append(_DIV_REMOVED % (line_num_a, esc(lines_a[i])))
                     line_num_a += 1
                 # Add empty lines to B for alignment
-                for _ in range(i1, i2):
-                    html_b.append(f'<div style="background-color: #2a2a2a; color: #666;"><span style="color: #555; user-select: none;">&nbsp;&nbsp;&nbsp;&nbsp;</span>&nbsp;&nbsp;{"&nbsp;" * 50}</div>')
+                html_b.extend([_DIV_FILLER] * (i2 - i1))
             elif tag == 'insert':
                 # Line only in B
                 for j in range(j1, j2):
-                    html_b.append(f'<div style="background-color: #1f4a1f; color: #6bff6b;"><span style="color: #99ff99; user-select: none;">{line_num_b:4d}</span>&nbsp;&nbsp;{self._escape_html(lines_b[j])}</div>')
+                    html_b.append(_DIV_ADDED % (line_num_b, esc(lines_b[j])))
                     line_num_b += 1
                 # Add empty lines to A for alignment
-                for _ in range(j1, j2):
-                    html_a.append(f'<div style="background-color: #2a2a2a; color: #666;"><span style="color: #555; user-select: none;">&nbsp;&nbsp;&nbsp;&nbsp;</span>&nbsp;&nbsp;{"&nbsp;" * 50}</div>')
+                html_a.extend([_DIV_FILLER] * (j2 - j1))
 
-        self.text_a.setHtml('<pre style="font-family: Courier; font-size: 18pt; margin: 0; padding: 0;">' + ''.join(html_a) + '</pre>')
-        self.text_b.setHtml('<pre style="font-family: Courier; font-size: 18pt; margin: 0; padding: 0;">' + ''.join(html_b) + '</pre>')
+        self.text_a.setHtml(_PRE_WRAP % ''.join(html_a))
+        self.text_b.setHtml(_PRE_WRAP % ''.join(html_b))
 
     def _show_unified_diff(self, text_a, text_b):
         """Show unified diff format"""
@@ -565,154 +775,325 @@ class SideBySideDiffWidget(QWidget):
         )
 
         html_lines = []
+        esc = self._escape_html
         for line in diff:
             if line.startswith('+++') or line.startswith('---'):
-                html_lines.append(f'<div style="background-color: #2a2a2a; color: #888; font-weight: bold;">{self._escape_html(line)}</div>')
+                html_lines.append(_UDIFF_FILE % esc(line))
             elif line.startswith('+'):
-                html_lines.append(f'<div style="background-color: #1f4a1f; color: #6bff6b;">{self._escape_html(line)}</div>')
+                html_lines.append(_UDIFF_ADDED % esc(line))
             elif line.startswith('-'):
-                html_lines.append(f'<div style="background-color: #4a1f1f; color: #ff6b6b;">{self._escape_html(line)}</div>')
+                html_lines.append(_UDIFF_REMOVED % esc(line))
             elif line.startswith('@@'):
-                html_lines.append(f'<div style="background-color: #1f1f4a; color: #6b6bff; font-weight: bold;">{self._escape_html(line)}</div>')
+                html_lines.append(_UDIFF_HUNK % esc(line))
             else:
-                html_lines.append(f'<div style="background-color: #1e1e1e; color: #d4d4d4;">{self._escape_html(line)}</div>')
+                html_lines.append(_UDIFF_CONTEXT % esc(line))
 
-        unified_html = '<pre style="font-family: Courier; font-size: 18pt; margin: 0; padding: 0;">' + ''.join(html_lines) + '</pre>'
+        unified_html = _PRE_WRAP % ''.join(html_lines)
 
         # Show unified diff in left pane, hide right pane
         self.text_a.setHtml(unified_html)
-        self.text_b.setHtml('<pre style="font-family: Courier; font-size: 18pt; margin: 0; padding: 0;"><div style="color: #666;">Unified diff shown on left</div></pre>')
+        self.text_b.setHtml(_PRE_WRAP % '<div style="color: #666;">Unified diff shown on left</div>')
 
     def _escape_html(self, text):
         """Escape HTML special characters and preserve whitespace"""
-        return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace(' ', '&nbsp;').replace('\t', '&nbsp;&nbsp;&nbsp;&nbsp;')
+        return html.escape(text, quote=False).translate(_WS_TABLE)
 
 
-class DiffResultsTableModel(QAbstractTableModel):
-    """Custom table model for diff results with sorting support"""
+class ResultColumns:
+    """Columnar (struct-of-arrays) view of matched-function results.
+
+    Sorting and filtering over thousands of matches is dominated by per-row
+    dict-chain accessors when the results live in a list of nested dicts.
+    Keeping each column in a contiguous NumPy array lets the hot paths use
+    vectorized comparisons and argsort instead of Python-level loops.
+    """
+
+    # Integer codes for the known match types; 0 is reserved for anything
+    # unrecognized so bincount always has a defined slot
+    MATCH_TYPE_CODES = {'Exact': 1, 'Structural': 2, 'Heuristic': 3}
 
     def __init__(self, results=None):
-        super().__init__()
         self.results = results or []
+        count = len(self.results)
+        funcs_a = [r.get('function_a', {}) for r in self.results]
+        funcs_b = [r.get('function_b', {}) for r in self.results]
+
+        self.names_a = [f.get('name', '') for f in funcs_a]
+        self.names_b = [f.get('name', '') for f in funcs_b]
+        # Case-folded copies so the name filter doesn't re-lower every
+        # string on each keystroke
+        self.names_a_lower = [n.lower() for n in self.names_a]
+        self.names_b_lower = [n.lower() for n in self.names_b]
+        self.match_types = [r.get('match_type', '') for r in self.results]
+
+        self.addr_a = np.fromiter((f.get('address', 0) for f in funcs_a), dtype=np.uint64, count=count)
+        self.addr_b = np.fromiter((f.get('address', 0) for f in funcs_b), dtype=np.uint64, count=count)
+        self.similarity = np.fromiter((r.get('similarity', 0) for r in self.results), dtype=np.float32, count=count)
+        self.confidence = np.fromiter((r.get('confidence', 0) for r in self.results), dtype=np.float32, count=count)
+        self.size_a = np.fromiter((f.get('size', 0) for f in funcs_a), dtype=np.int64, count=count)
+        self.size_b = np.fromiter((f.get('size', 0) for f in funcs_b), dtype=np.int64, count=count)
+        self.bb_count_a = np.fromiter((len(f.get('basic_blocks', ())) for f in funcs_a), dtype=np.int64, count=count)
+        self.bb_count_b = np.fromiter((len(f.get('basic_blocks', ())) for f in funcs_b), dtype=np.int64, count=count)
+        self.instr_count_a = np.fromiter((len(f.get('instructions', ())) for f in funcs_a), dtype=np.int64, count=count)
+        self.instr_count_b = np.fromiter((len(f.get('instructions', ())) for f in funcs_b), dtype=np.int64, count=count)
+        codes = self.MATCH_TYPE_CODES
+        self.mt_codes = np.fromiter((codes.get(t, 0) for t in self.match_types), dtype=np.int8, count=count)
+
+        # Display strings formatted once here; Qt queries DisplayRole per
+        # visible cell per repaint, so data() should only index, not format
+        self.fmt_addr_a = [f"0x{a:x}" for a in self.addr_a]
+        self.fmt_addr_b = [f"0x{a:x}" for a in self.addr_b]
+        self.fmt_sim = [f"{v:.4f}" for v in self.similarity]
+        self.fmt_conf = [f"{v:.4f}" for v in self.confidence]
+        self.fmt_size_a = [str(v) for v in self.size_a]
+        self.fmt_size_b = [str(v) for v in self.size_b]
+        self.fmt_bb_count_a = [str(v) for v in self.bb_count_a]
+        self.fmt_bb_count_b = [str(v) for v in self.bb_count_b]
+        self.fmt_instr_count_a = [str(v) for v in self.instr_count_a]
+        self.fmt_instr_count_b = [str(v) for v in self.instr_count_b]
+
+        # Zero-padded export address strings and HTML-escaped names, built
+        # lazily on first export
+        self._fmt_addr16_a = None
+        self._fmt_addr16_b = None
+        self._esc_names_a = None
+        self._esc_names_b = None
+
+    def addr16_a(self):
+        """Addresses as 0x-prefixed 16-digit strings (CSV/SQLite/HTML exports)"""
+        if self._fmt_addr16_a is None:
+            self._fmt_addr16_a = [f"0x{a:016x}" for a in self.addr_a]
+        return self._fmt_addr16_a
+
+    def addr16_b(self):
+        """Addresses as 0x-prefixed 16-digit strings (CSV/SQLite/HTML exports)"""
+        if self._fmt_addr16_b is None:
+            self._fmt_addr16_b = [f"0x{a:016x}" for a in self.addr_b]
+        return self._fmt_addr16_b
+
+    def esc_names_a(self):
+        """HTML-escaped function names for the report exporter"""
+        if self._esc_names_a is None:
+            self._esc_names_a = [html.escape(n) for n in self.names_a]
+        return self._esc_names_a
+
+    def esc_names_b(self):
+        """HTML-escaped function names for the report exporter"""
+        if self._esc_names_b is None:
+            self._esc_names_b = [html.escape(n) for n in self.names_b]
+        return self._esc_names_b
+
+    def __len__(self):
+        return len(self.results)
+
+
+class DiffResultsTableModel(QAbstractTableModel):
+    """Custom table model for diff results with sorting and lazy row loading"""
+
+    # Rows materialized per fetchMore call; the view requests more as the
+    # user scrolls, so opening the window stays O(1) in result count
+    FETCH_BATCH = 500
+
+    # Maps a model column to the ResultColumns array holding its sort keys
+    _ARRAY_COLUMNS = {
+        0: 'similarity', 1: 'confidence', 3: 'addr_a', 5: 'addr_b',
+        7: 'size_a', 8: 'size_b', 9: 'bb_count_a', 10: 'bb_count_b',
+        11: 'instr_count_a', 12: 'instr_count_b',
+    }
+    # Maps a model column to the ResultColumns list holding its strings
+    _STRING_COLUMNS = {2: 'names_a', 4: 'names_b', 6: 'match_types'}
+
+    def __init__(self, columns=None):
+        super().__init__()
+        # Shared role payloads; data() is called once per visible cell per
+        # role, so constructing these per call churns thousands of temporaries
+        self._bg_color = QColor(43, 43, 43)       # Dark gray background
+        self._text_color = QColor(255, 255, 255)  # White text
+        self._link_color = QColor(100, 149, 237)  # Light blue for clickable links
+        self._link_font = QFont()
+        self._link_font.setUnderline(True)
+        self.columns = columns or ResultColumns()
+        self.row_indices = np.arange(len(self.columns), dtype=np.intp)
+        self._loaded = min(self.FETCH_BATCH, len(self.row_indices))
         self.headers = [
-            "Function A", "Address A", "Function B", "Address B",
-            "Similarity", "Confidence", "Match Type", "Size A", "Size B",
+            "Similarity", "Confidence", "Function A", "Address A", "Function B", "Address B",
+            "Match Type", "Size A", "Size B",
             "BB Count A", "BB Count B", "Instr Count A", "Instr Count B"
         ]
 
     def rowCount(self, parent=QModelIndex()):
-        return len(self.results)
+        return self._loaded
 
     def columnCount(self, parent=QModelIndex()):
         return len(self.headers)
 
+    def canFetchMore(self, parent=QModelIndex()):
+        return self._loaded < len(self.row_indices)
+
+    def fetchMore(self, parent=QModelIndex()):
+        to_fetch = min(len(self.row_indices) - self._loaded, self.FETCH_BATCH)
+        if to_fetch <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + to_fetch - 1)
+        self._loaded += to_fetch
+        self.endInsertRows()
+
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
             return self.headers[section]
         return None
 
     def data(self, index, role=Qt.DisplayRole):
-        if not index.isValid() or index.row() >= len(self.results):
+        if not index.isValid() or index.row() >= len(self.row_indices):
             return None
 
-        result = self.results[index.row()]
+        row = self.row_indices[index.row()]
         column = index.column()
 
         if role == Qt.DisplayRole:
-            if column == 0:  # Function A
-                return result.get('function_a', {}).get('name', '')
-            elif column == 1:  # Address A
-                return f"0x{result.get('function_a', {}).get('address', 0):x}"
-            elif column == 2:  # Function B
-                return result.get('function_b', {}).get('name', '')
-            elif column == 3:  # Address B
-                return f"0x{result.get('function_b', {}).get('address', 0):x}"
-            elif column == 4:  # Similarity
-                return f"{result.get('similarity', 0):.4f}"
-            elif column == 5:  # Confidence
-                return f"{result.get('confidence', 0):.4f}"
+            if column == 0:  # Similarity
+                return self.columns.fmt_sim[row]
+            elif column == 1:  # Confidence
+                return self.columns.fmt_conf[row]
+            elif column == 2:  # Function A
+                return self.columns.names_a[row]
+            elif column == 3:  # Address A
+                return self.columns.fmt_addr_a[row]
+            elif column == 4:  # Function B
+                return self.columns.names_b[row]
+            elif column == 5:  # Address B
+                return self.columns.fmt_addr_b[row]
             elif column == 6:  # Match Type
-                return result.get('match_type', '')
+                return self.columns.match_types[row]
             elif column == 7:  # Size A
-                return str(result.get('function_a', {}).get('size', 0))
+                return self.columns.fmt_size_a[row]
             elif column == 8:  # Size B
-                return str(result.get('function_b', {}).get('size', 0))
+                return self.columns.fmt_size_b[row]
             elif column == 9:  # BB Count A
-                return str(len(result.get('function_a', {}).get('basic_blocks', [])))
+                return self.columns.fmt_bb_count_a[row]
             elif column == 10:  # BB Count B
-                return str(len(result.get('function_b', {}).get('basic_blocks', [])))
+                return self.columns.fmt_bb_count_b[row]
             elif column == 11:  # Instr Count A
-                return str(len(result.get('function_a', {}).get('instructions', [])))
+                return self.columns.fmt_instr_count_a[row]
             elif column == 12:  # Instr Count B
-                return str(len(result.get('function_b', {}).get('instructions', [])))
+                return self.columns.fmt_instr_count_b[row]
 
         elif role == Qt.BackgroundRole:
             # Use default dark background for all columns
-            return QColor(43, 43, 43)  # Dark gray background
+            return self._bg_color
 
-        elif role == Qt.TextColorRole:
+        elif role == Qt.ForegroundRole:
             # Set text color - white for all columns except address links
-            if column in [1, 3]:  # Address columns (clickable links)
-                return QColor(100, 149, 237)  # Light blue for clickable links
+            if column in [3, 5]:  # Address columns (clickable links)
+                return self._link_color
             else:
-                return QColor(255, 255, 255)  # White text for all columns
+                return self._text_color
+
+        elif role == Qt.FontRole:
+            if column in [3, 5]:  # Underline addresses so they read as links
+                return self._link_font
+
+        elif role == Qt.ToolTipRole:
+            if column in [3, 5]:
+                return "Click to navigate to this address in Binary Ninja"
+
+        elif role == Qt.UserRole:
+            # Raw numeric value for the sortable columns
+            array_name = self._ARRAY_COLUMNS.get(column)
+            if array_name is not None:
+                return getattr(self.columns, array_name)[row].item()
 
         return None
 
     def sort(self, column, order):
         """Sort the data by the given column"""
-        if column == 0:  # Function A
-            key = lambda x: x.get('function_a', {}).get('name', '')
-        elif column == 1:  # Address A
-            key = lambda x: x.get('function_a', {}).get('address', 0)
-        elif column == 2:  # Function B
-            key = lambda x: x.get('function_b', {}).get('name', '')
-        elif column == 3:  # Address B
-            key = lambda x: x.get('function_b', {}).get('address', 0)
-        elif column == 4:  # Similarity
-            key = lambda x: x.get('similarity', 0)
-        elif column == 5:  # Confidence
-            key = lambda x: x.get('confidence', 0)
-        elif column == 6:  # Match Type
-            key = lambda x: x.get('match_type', '')
-        elif column == 7:  # Size A
-            key = lambda x: x.get('function_a', {}).get('size', 0)
-        elif column == 8:  # Size B
-            key = lambda x: x.get('function_b', {}).get('size', 0)
-        elif column == 9:  # BB Count A
-            key = lambda x: len(x.get('function_a', {}).get('basic_blocks', []))
-        elif column == 10:  # BB Count B
-            key = lambda x: len(x.get('function_b', {}).get('basic_blocks', []))
-        elif column == 11:  # Instr Count A
-            key = lambda x: len(x.get('function_a', {}).get('instructions', []))
-        elif column == 12:  # Instr Count B
-            key = lambda x: len(x.get('function_b', {}).get('instructions', []))
-        else:
-            key = lambda x: 0
+        self.layoutAboutToBeChanged.emit()
+        descending = (order == Qt.DescendingOrder)
+
+        array_name = self._ARRAY_COLUMNS.get(column)
+        if array_name is not None:
+            # Vectorized sort over the contiguous column array
+            keys = getattr(self.columns, array_name)[self.row_indices]
+            sort_order = np.argsort(keys, kind='stable')
+            if descending:
+                sort_order = sort_order[::-1]
+            self.row_indices = self.row_indices[sort_order]
+        elif column in self._STRING_COLUMNS:
+            # Sort positions against the string list, then permute the index
+            # array with one fancy-indexing pass
+            strings = getattr(self.columns, self._STRING_COLUMNS[column])
+            row_indices = self.row_indices
+            order = sorted(range(len(row_indices)),
+                           key=lambda k: strings[row_indices[k]].lower(),
+                           reverse=descending)
+            self.row_indices = row_indices[order]
 
+        self.layoutChanged.emit()
+
+    def reverse_rows(self):
+        """Reverse the current row order without re-sorting"""
         self.layoutAboutToBeChanged.emit()
-        self.results.sort(key=key, reverse=(order == Qt.DescendingOrder))
+        self.row_indices = self.row_indices[::-1]
         self.layoutChanged.emit()
 
-    def update_data(self, results):
-        """Update the model with new data"""
+    def update_data(self, columns, row_indices=None):
+        """Update the model with new columnar data"""
         self.beginResetModel()
-        self.results = results
+        self.columns = columns
+        if row_indices is None:
+            row_indices = np.arange(len(columns), dtype=np.intp)
+        self.row_indices = row_indices
+        self._loaded = min(self.FETCH_BATCH, len(self.row_indices))
         self.endResetModel()
 
 
+class ExportWorker(QThread):
+    """Runs an export callable off the GUI thread, reporting progress.
+
+    Keeps large exports from blocking the Qt event loop; the callable
+    receives the target filename and a progress callback that forwards to
+    the window's progress bar via the queued `progress` signal.
+    """
+
+    progress = Signal(int)
+    finished_ok = Signal(str)
+    error = Signal(str)
+
+    def __init__(self, fn, filename, snapshot, parent=None):
+        super().__init__(parent)
+        self._fn = fn
+        self._filename = filename
+        # (columns, idx, results) captured on the GUI thread; the writer
+        # must not read window attributes the filter/sort handlers swap
+        self._snapshot = snapshot
+
+    def run(self):
+        try:
+            self._fn(self._filename, *self._snapshot, self.progress.emit)
+            self.finished_ok.emit(self._filename)
+        except _EXPORT_ERRORS as e:
+            self.error.emit(str(e))
+
+
 class DiffResultsWindow(QMainWindow):
     """Main window for displaying diff results"""
 
     def __init__(self, results_data=None, binary_view_a=None, binary_view_b=None):
         super().__init__()
         self.results_data = results_data or {}
+        self.all_results = []
         self.filtered_results = []
+        self.columns = ResultColumns()
+        self.filtered_idx = np.arange(0, dtype=np.intp)
+        # Export-row cache keyed by snapshot identity; only the (single)
+        # export worker writes it, so the GUI thread never races it
+        self._flat_rows = None
+        self._match_idx = None  # Lazy (addr_a, addr_b) lookup; see _match_index
+        self._export_worker = None
         self.sort_column = -1
         self.sort_order = Qt.AscendingOrder
         self.binary_view_a = binary_view_a  # Binary Ninja view for binary A
         self.binary_view_b = binary_view_b  # Binary Ninja view for binary B
-        self._initial_column_widths_set = False  # Track if column widths have been set
         self.setup_ui()
         self.load_results()
 
@@ -728,8 +1109,8 @@ class DiffResultsWindow(QMainWindow):
         # Main layout
         main_layout = QVBoxLayout(central_widget)
 
-        # Create tabs
-        tabs = QTabWidget()
+        # Create tabs; keep a reference so handlers can switch tabs directly
+        self.tabs = tabs = QTabWidget()
         main_layout.addWidget(tabs)
 
         # Side-by-side diff tab (NEW - first tab for easy access)
@@ -767,23 +1148,31 @@ class DiffResultsWindow(QMainWindow):
         self.match_type_combo.currentTextChanged.connect(self.apply_filters)
         filters_layout.addWidget(self.match_type_combo, 0, 1)
 
+        # Debounce the text filters: each keystroke restarts the timer, so a
+        # typing burst runs one filter pass instead of one per character.
+        # The combo box stays synchronous since it fires once per selection.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self.apply_filters)
+
         # Similarity threshold
         filters_layout.addWidget(QLabel("Min Similarity:"), 0, 2)
         self.similarity_threshold = QLineEdit("0.0")
-        self.similarity_threshold.textChanged.connect(self.apply_filters)
+        self.similarity_threshold.textChanged.connect(self._schedule_filter)
         filters_layout.addWidget(self.similarity_threshold, 0, 3)
 
         # Confidence threshold
         filters_layout.addWidget(QLabel("Min Confidence:"), 0, 4)
         self.confidence_threshold = QLineEdit("0.0")
-        self.confidence_threshold.textChanged.connect(self.apply_filters)
+        self.confidence_threshold.textChanged.connect(self._schedule_filter)
         filters_layout.addWidget(self.confidence_threshold, 0, 5)
 
         # Function name filter
         filters_layout.addWidget(QLabel("Function Name:"), 1, 0)
         self.function_name_filter = QLineEdit()
         self.function_name_filter.setPlaceholderText("Filter by function name...")
-        self.function_name_filter.textChanged.connect(self.apply_filters)
+        self.function_name_filter.textChanged.connect(self._schedule_filter)
         filters_layout.addWidget(self.function_name_filter, 1, 1, 1, 2)
 
         # Reset filters button
@@ -793,28 +1182,30 @@ class DiffResultsWindow(QMainWindow):
 
         layout.addWidget(filters_group)
 
-        # Results table
+        # Results table - a view over the columnar model, so only visible
+        # rows are materialized instead of one widget item per cell
         self.table_model = DiffResultsTableModel()
-        self.table_view = QTableWidget()
+        self.table_view = QTableView()
+        self.table_view.setModel(self.table_model)
         self.table_view.setSortingEnabled(False)  # Disable built-in sorting to use custom sorting
         self.table_view.setAlternatingRowColors(False)  # Disable to allow custom background colors
-        self.table_view.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table_view.setSelectionBehavior(QTableView.SelectRows)
         self.table_view.horizontalHeader().setStretchLastSection(True)
 
         # Set table styling for better contrast with white text
         self.table_view.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #2b2b2b;
                 gridline-color: #555555;
                 color: white;
                 selection-background-color: #3daee9;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 12px 8px;
                 border: 1px solid #555555;
                 min-height: 32px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #3daee9;
             }
             QHeaderView::section {
@@ -835,12 +1226,42 @@ class DiffResultsWindow(QMainWindow):
         self.table_view.verticalHeader().setDefaultSectionSize(40)
         self.table_view.verticalHeader().setMinimumSectionSize(35)
 
-        # Enable custom sorting for numeric columns
+        # Set explicit column widths that accommodate header text + sort indicator.
+        # Fixed widths sidestep resizeColumnsToContents, which would measure
+        # every cell's text on each refresh
+        column_widths = [
+            200,  # Similarity
+            200,  # Confidence
+            240,  # Function A
+            190,  # Address A
+            240,  # Function B
+            190,  # Address B
+            190,  # Match Type
+            110,  # Size A
+            110,  # Size B
+            190,  # BB Count A
+            190,  # BB Count B
+            190,  # Instr Count A
+            190,  # Instr Count B
+        ]
+        for col, width in enumerate(column_widths):
+            self.table_view.setColumnWidth(col, width)
+
+        # Set header resize mode to Interactive so users can resize but sorting won't change widths
+        header = self.table_view.horizontalHeader()
+        for col in range(self.table_model.columnCount()):
+            header.setSectionResizeMode(col, QHeaderView.Interactive)
+
+        # Enable custom sorting for numeric columns; the indicator starts
+        # hidden and is shown per-section once a sort is active
+        self.table_view.horizontalHeader().setSortIndicatorShown(False)
         self.table_view.horizontalHeader().sectionClicked.connect(self.sort_table)
 
         # Enable row selection to load side-by-side diff and address navigation
-        self.table_view.cellClicked.connect(self.on_cell_clicked)
-        self.table_view.cellDoubleClicked.connect(self.on_cell_double_clicked)
+        self.table_view.clicked.connect(
+            lambda index: self.on_cell_clicked(index.row(), index.column()))
+        self.table_view.doubleClicked.connect(
+            lambda index: self.on_cell_double_clicked(index.row(), index.column()))
 
         layout.addWidget(self.table_view)
 
@@ -936,6 +1357,12 @@ class DiffResultsWindow(QMainWindow):
         html_button.clicked.connect(self.export_to_html)
         export_layout.addWidget(html_button, 1, 0)
 
+        # Parquet export (only when pyarrow is installed)
+        if pa is not None:
+            parquet_button = QPushButton("Export to Parquet")
+            parquet_button.clicked.connect(self.export_to_parquet)
+            export_layout.addWidget(parquet_button, 1, 1)
+
         layout.addWidget(export_group)
 
         # Export current diff view
@@ -983,6 +1410,11 @@ class DiffResultsWindow(QMainWindow):
         for match in matched_functions:
             self.all_results.append(match)
 
+        # Build the columnar view used by the filter and sort hot paths
+        self.columns = ResultColumns(self.all_results)
+        self.filtered_idx = np.arange(len(self.columns), dtype=np.intp)
+        self._match_idx = None
+
         # Update filtered results
         self.filtered_results = self.all_results.copy()
         self.update_table()
@@ -995,148 +1427,15 @@ class DiffResultsWindow(QMainWindow):
 
     def update_table(self):
         """Update the table with current filtered results"""
-        self.table_view.setRowCount(len(self.filtered_results))
-        self.table_view.setColumnCount(13)
+        # The model serves cells on demand from the columnar view; only the
+        # first FETCH_BATCH rows are materialized until the user scrolls
+        self.table_model.update_data(self.columns, self.filtered_idx)
 
-        # Set headers
-        headers = [
-            "Similarity", "Confidence", "Function A", "Address A", "Function B", "Address B",
-            "Match Type", "Size A", "Size B",
-            "BB Count A", "BB Count B", "Instr Count A", "Instr Count B"
-        ]
-        self.table_view.setHorizontalHeaderLabels(headers)
-
-        # Populate table
-        for row, result in enumerate(self.filtered_results):
-            func_a = result.get('function_a', {})
-            func_b = result.get('function_b', {})
-
-            # Column 0: Similarity (numeric)
-            similarity_item = QTableWidgetItem(f"{result.get('similarity', 0):.4f}")
-            similarity_item.setData(Qt.UserRole, result.get('similarity', 0))
-            self.table_view.setItem(row, 0, similarity_item)
-
-            # Column 1: Confidence (numeric)
-            confidence_item = QTableWidgetItem(f"{result.get('confidence', 0):.4f}")
-            confidence_item.setData(Qt.UserRole, result.get('confidence', 0))
-            self.table_view.setItem(row, 1, confidence_item)
-
-            # Column 2: Function A name (string)
-            self.table_view.setItem(row, 2, QTableWidgetItem(func_a.get('name', '')))
-
-            # Column 3: Address A (numeric, clickable)
-            addr_a_item = QTableWidgetItem(f"0x{func_a.get('address', 0):x}")
-            addr_a_item.setData(Qt.UserRole, str(func_a.get('address', 0)))
-            # Make address clickable by changing font to underlined
-            font = addr_a_item.font()
-            font.setUnderline(True)
-            addr_a_item.setFont(font)
-            addr_a_item.setForeground(QColor(100, 149, 237))  # Light blue color for clickable link
-            addr_a_item.setToolTip("Click to navigate to this address in Binary Ninja")
-            self.table_view.setItem(row, 3, addr_a_item)
-
-            # Column 4: Function B name (string)
-            self.table_view.setItem(row, 4, QTableWidgetItem(func_b.get('name', '')))
-
-            # Column 5: Address B (numeric, clickable)
-            addr_b_item = QTableWidgetItem(f"0x{func_b.get('address', 0):x}")
-            addr_b_item.setData(Qt.UserRole, str(func_b.get('address', 0)))
-            # Make address clickable by changing font to underlined
-            font = addr_b_item.font()
-            font.setUnderline(True)
-            addr_b_item.setFont(font)
-            addr_b_item.setForeground(QColor(100, 149, 237))  # Light blue color for clickable link
-            addr_b_item.setToolTip("Click to navigate to this address in Binary Ninja")
-            self.table_view.setItem(row, 5, addr_b_item)
-
-            # Column 6: Match Type (string)
-            self.table_view.setItem(row, 6, QTableWidgetItem(result.get('match_type', '')))
-
-            # Column 7: Size A (numeric)
-            size_a_item = QTableWidgetItem(str(func_a.get('size', 0)))
-            size_a_item.setData(Qt.UserRole, func_a.get('size', 0))
-            self.table_view.setItem(row, 7, size_a_item)
-
-            # Column 8: Size B (numeric)
-            size_b_item = QTableWidgetItem(str(func_b.get('size', 0)))
-            size_b_item.setData(Qt.UserRole, func_b.get('size', 0))
-            self.table_view.setItem(row, 8, size_b_item)
-
-            # Column 9: BB Count A (numeric)
-            bb_a_count = len(func_a.get('basic_blocks', []))
-            bb_a_item = QTableWidgetItem(str(bb_a_count))
-            bb_a_item.setData(Qt.UserRole, bb_a_count)
-            self.table_view.setItem(row, 9, bb_a_item)
-
-            # Column 10: BB Count B (numeric)
-            bb_b_count = len(func_b.get('basic_blocks', []))
-            bb_b_item = QTableWidgetItem(str(bb_b_count))
-            bb_b_item.setData(Qt.UserRole, bb_b_count)
-            self.table_view.setItem(row, 10, bb_b_item)
-
-            # Column 11: Instr Count A (numeric)
-            instr_a_count = len(func_a.get('instructions', []))
-            instr_a_item = QTableWidgetItem(str(instr_a_count))
-            instr_a_item.setData(Qt.UserRole, instr_a_count)
-            self.table_view.setItem(row, 11, instr_a_item)
-
-            # Column 12: Instr Count B (numeric)
-            instr_b_count = len(func_b.get('instructions', []))
-            instr_b_item = QTableWidgetItem(str(instr_b_count))
-            instr_b_item.setData(Qt.UserRole, instr_b_count)
-            self.table_view.setItem(row, 12, instr_b_item)
-
-        # Apply consistent styling after all items are created
-        for row in range(len(self.filtered_results)):
-            for col in range(13):
-                item = self.table_view.item(row, col)
-                if item:
-                    # Use default dark background for all columns
-                    item.setBackground(QColor(43, 43, 43))  # Dark gray background
-
-                    # Set text color - white for all columns except address links
-                    if col in [3, 5]:  # Address columns remain blue (clickable links)
-                        # Address links keep their blue color (already set above)
-                        pass
-                    else:
-                        item.setForeground(QColor(255, 255, 255))  # White text for all columns
-
-        # Only resize columns on initial load to prevent width changes during sorting
-        if not self._initial_column_widths_set:
-            # Set explicit column widths that accommodate header text + sort indicator
-            # Headers: "Similarity", "Confidence", "Function A", "Address A", "Function B", "Address B",
-            #          "Match Type", "Size A", "Size B", "BB Count A", "BB Count B", "Instr Count A", "Instr Count B"
-            column_widths = [
-                200,  # Similarity
-                200,  # Confidence
-                240,  # Function A
-                190,  # Address A
-                240,  # Function B
-                190,  # Address B
-                190,  # Match Type
-                110,  # Size A
-                110,  # Size B
-                190,  # BB Count A
-                190,  # BB Count B
-                190,  # Instr Count A
-                190,  # Instr Count B
-            ]
-
-            for col, width in enumerate(column_widths):
-                self.table_view.setColumnWidth(col, width)
-
-            # Set header resize mode to Interactive so users can resize but sorting won't change widths
-            header = self.table_view.horizontalHeader()
-            for col in range(self.table_view.columnCount()):
-                header.setSectionResizeMode(col, QHeaderView.Interactive)
-            # Keep last section stretching
-            header.setStretchLastSection(True)
-
-            self._initial_column_widths_set = True
+        # Column widths are fixed once in setup_results_tab; refreshes never
+        # trigger a text-metrics pass over the cells
 
-        # Ensure proper row height for all rows
-        for row in range(self.table_view.rowCount()):
-            self.table_view.setRowHeight(row, 40)
+        # Row height is uniform via the vertical header's default section
+        # size, so no per-row setRowHeight pass is needed
 
         # Update status
         self.results_count_label.setText(f"{len(self.filtered_results)} results")
@@ -1150,16 +1449,18 @@ class DiffResultsWindow(QMainWindow):
         unmatched_a = self.results_data.get('unmatched_functions_a', [])
         unmatched_b = self.results_data.get('unmatched_functions_b', [])
 
-        # Count match types
-        exact_count = sum(1 for m in matched_functions if m.get('match_type') == 'Exact')
-        structural_count = sum(1 for m in matched_functions if m.get('match_type') == 'Structural')
-        heuristic_count = sum(1 for m in matched_functions if m.get('match_type') == 'Heuristic')
-
-        # Calculate averages
-        if matched_functions:
-            avg_similarity = sum(m.get('similarity', 0) for m in matched_functions) / len(matched_functions)
-            avg_confidence = sum(m.get('confidence', 0) for m in matched_functions) / len(matched_functions)
+        # Count match types and averages over the columnar arrays; one
+        # bincount/mean pass instead of several Python-level sweeps
+        if len(self.columns):
+            cols = self.columns
+            type_counts = np.bincount(cols.mt_codes, minlength=4)
+            exact_count = int(type_counts[ResultColumns.MATCH_TYPE_CODES['Exact']])
+            structural_count = int(type_counts[ResultColumns.MATCH_TYPE_CODES['Structural']])
+            heuristic_count = int(type_counts[ResultColumns.MATCH_TYPE_CODES['Heuristic']])
+            avg_similarity = float(cols.similarity.mean())
+            avg_confidence = float(cols.confidence.mean())
         else:
+            exact_count = structural_count = heuristic_count = 0
             avg_similarity = 0
             avg_confidence = 0
 
@@ -1178,13 +1479,15 @@ class DiffResultsWindow(QMainWindow):
         self.binary_b_label.setText(self.results_data.get('binary_b_name', 'N/A'))
         self.analysis_time_label.setText(f"{self.results_data.get('analysis_time', 0):.2f}s")
 
+    def _schedule_filter(self, *_):
+        """Restart the filter debounce timer; only the final edit filters"""
+        self._filter_timer.start()
+
     def apply_filters(self):
         """Apply current filters to results"""
         if not self.all_results:
             return
 
-        self.filtered_results = []
-
         # Get filter values
         match_type_filter = self.match_type_combo.currentText()
         try:
@@ -1199,28 +1502,53 @@ class DiffResultsWindow(QMainWindow):
 
         function_name_filter = self.function_name_filter.text().lower()
 
-        # Apply filters
-        for result in self.all_results:
-            # Match type filter
-            if match_type_filter != "All" and result.get('match_type') != match_type_filter:
-                continue
-
-            # Similarity threshold
-            if result.get('similarity', 0) < similarity_threshold:
-                continue
+        # Apply filters as boolean masks over the columnar view
+        cols = self.columns
+        count = len(cols)
 
-            # Confidence threshold
-            if result.get('confidence', 0) < confidence_threshold:
-                continue
+        if (match_type_filter == "All" and not function_name_filter
+                and similarity_threshold <= 0.0 and confidence_threshold <= 0.0):
+            # Nothing to filter; skip the mask arithmetic entirely
+            new_idx = np.arange(count, dtype=np.intp)
+        else:
+            mask = (cols.similarity >= similarity_threshold) & (cols.confidence >= confidence_threshold)
+
+            if match_type_filter != "All":
+                # Vectorized integer compare against the int8 code column; falls
+                # back to string equality for types outside the code table
+                code = ResultColumns.MATCH_TYPE_CODES.get(match_type_filter)
+                if code is not None:
+                    mask &= (cols.mt_codes == code)
+                else:
+                    mask &= np.fromiter(
+                        (mt == match_type_filter for mt in cols.match_types),
+                        dtype=bool, count=count
+                    )
 
-            # Function name filter
             if function_name_filter:
-                func_a_name = result.get('function_a', {}).get('name', '').lower()
-                func_b_name = result.get('function_b', {}).get('name', '').lower()
-                if function_name_filter not in func_a_name and function_name_filter not in func_b_name:
-                    continue
+                mask &= np.fromiter(
+                    (function_name_filter in a or function_name_filter in b
+                     for a, b in zip(cols.names_a_lower, cols.names_b_lower)),
+                    dtype=bool, count=count
+                )
+
+            new_idx = np.nonzero(mask)[0]
 
-            self.filtered_results.append(result)
+        # Typing whitespace or re-selecting the same combo entry often leaves
+        # the output identical to what is already displayed; skip the model
+        # reset entirely in that case
+        if np.array_equal(new_idx, self.filtered_idx):
+            return
+
+        self.filtered_idx = new_idx
+        self.filtered_results = [self.all_results[i] for i in new_idx]
+        self._match_idx = None
+
+        # The new index is in original order, so any previous sort no longer
+        # holds; reset it so the same-column reverse fast path in sort_table
+        # can't flip an unsorted view while the header claims otherwise
+        self.sort_column = -1
+        self.update_sort_indicator()
 
         self.update_table()
 
@@ -1237,100 +1565,50 @@ class DiffResultsWindow(QMainWindow):
         # Toggle sort order if clicking same column
         if self.sort_column == column:
             self.sort_order = Qt.DescendingOrder if self.sort_order == Qt.AscendingOrder else Qt.AscendingOrder
+            # Same column toggled: the rows are already ordered by this key,
+            # so reversing the index array replaces an O(N log N) argsort
+            self.table_model.reverse_rows()
         else:
             self.sort_order = Qt.AscendingOrder
-
-        self.sort_column = column
-
-        # Numeric columns that need special sorting
-        numeric_columns = [0, 1, 3, 5, 7, 8, 9, 10, 11, 12]  # Addresses, similarity, confidence, sizes, counts
-
-        if column in numeric_columns:
-            # Sort by numeric value stored in UserRole
-            self.filtered_results.sort(
-                key=lambda x: self.get_numeric_sort_key(x, column),
-                reverse=(self.sort_order == Qt.DescendingOrder)
-            )
-        else:
-            # Sort by string value (function names, match type)
-            self.filtered_results.sort(
-                key=lambda x: self.get_string_sort_key(x, column),
-                reverse=(self.sort_order == Qt.DescendingOrder)
-            )
-
-        # Refresh the table with sorted data
-        self.update_table()
+            self.sort_column = column
+            # The model sorts its row index array in place (argsort for
+            # array-backed columns); mirror the result for consumers that
+            # still walk the filtered list
+            self.table_model.sort(column, self.sort_order)
+        self.filtered_idx = self.table_model.row_indices
+        self.filtered_results = [self.all_results[i] for i in self.filtered_idx]
+        self._match_idx = None
 
         # Update header to show sort indicator
         self.update_sort_indicator()
 
-    def get_numeric_sort_key(self, result, column):
-        """Get numeric sort key for a result"""
-        func_a = result.get('function_a', {})
-        func_b = result.get('function_b', {})
-
-        if column == 3:  # Address A
-            return func_a.get('address', 0)
-        elif column == 5:  # Address B
-            return func_b.get('address', 0)
-        elif column == 0:  # Similarity
-            return result.get('similarity', 0)
-        elif column == 1:  # Confidence
-            return result.get('confidence', 0)
-        elif column == 7:  # Size A
-            return func_a.get('size', 0)
-        elif column == 8:  # Size B
-            return func_b.get('size', 0)
-        elif column == 9:  # BB Count A
-            return len(func_a.get('basic_blocks', []))
-        elif column == 10:  # BB Count B
-            return len(func_b.get('basic_blocks', []))
-        elif column == 11:  # Instr Count A
-            return len(func_a.get('instructions', []))
-        elif column == 12:  # Instr Count B
-            return len(func_b.get('instructions', []))
-        else:
-            return 0
-
-    def get_string_sort_key(self, result, column):
-        """Get string sort key for a result"""
-        func_a = result.get('function_a', {})
-        func_b = result.get('function_b', {})
-
-        if column == 2:  # Function A name
-            return func_a.get('name', '').lower()
-        elif column == 4:  # Function B name
-            return func_b.get('name', '').lower()
-        elif column == 6:  # Match Type
-            return result.get('match_type', '').lower()
-        else:
-            return ''
-
     def update_sort_indicator(self):
         """Update the header to show sort direction indicator using Qt's built-in indicator"""
+        # Qt's built-in indicator repaints only the affected header section,
+        # so no header labels or widths are touched here
         header = self.table_view.horizontalHeader()
         if self.sort_column >= 0:
-            # Use Qt's built-in sort indicator instead of modifying header text
-            header.setSortIndicator(self.sort_column, self.sort_order)
             header.setSortIndicatorShown(True)
+            header.setSortIndicator(self.sort_column, self.sort_order)
         else:
             header.setSortIndicatorShown(False)
 
     def on_cell_clicked(self, row, column):
         """Handle cell clicks - load function pair in diff view or navigate to address"""
         try:
-            # Get the result for this row
-            if row < len(self.filtered_results):
-                result = self.filtered_results[row]
+            # Get the result for this row via the filtered index array
+            if row < len(self.filtered_idx):
+                result_idx = self.filtered_idx[row]
+                result = self.all_results[result_idx]
 
                 # Check if clicked column is an address column (Address A or Address B)
                 if column in [3, 5]:  # Address A or Address B
                     if column == 3:  # Address A
-                        address = result.get('function_a', {}).get('address', 0)
+                        address = int(self.columns.addr_a[result_idx])
                         binary_view = self.binary_view_a
                         binary_name = "Binary A"
                     else:  # Address B
-                        address = result.get('function_b', {}).get('address', 0)
+                        address = int(self.columns.addr_b[result_idx])
                         binary_view = self.binary_view_b
                         binary_name = "Binary B"
 
@@ -1367,16 +1645,11 @@ class DiffResultsWindow(QMainWindow):
     def on_cell_double_clicked(self, row, column):
         """Handle double-click - load function pair and switch to diff tab"""
         try:
-            if row < len(self.filtered_results):
-                result = self.filtered_results[row]
+            if row < len(self.filtered_idx):
+                result = self.all_results[self.filtered_idx[row]]
                 self.load_function_pair_to_diff(result)
-                # Switch to the diff tab (index 0)
-                parent_widget = self.parent()
-                while parent_widget:
-                    if isinstance(parent_widget, QTabWidget):
-                        parent_widget.setCurrentIndex(0)  # Switch to Side-by-Side Diff tab
-                        break
-                    parent_widget = parent_widget.parent()
+                # Switch to the Side-by-Side Diff tab (index 0)
+                self.tabs.setCurrentIndex(0)
 
         except Exception as e:
             QMessageBox.critical(
@@ -1435,54 +1708,129 @@ class DiffResultsWindow(QMainWindow):
         if not filename:
             return
 
+        self._start_export(self._write_csv, filename)
+
+    def _start_export(self, fn, filename):
+        """Run an export callable on a worker thread with progress feedback"""
+        # One export at a time; the writers read the filtered view, so a
+        # second worker racing the first could interleave state changes
+        if self._export_worker is not None and self._export_worker.isRunning():
+            QMessageBox.information(self, "Export Running", "Please wait for the current export to finish.")
+            return
+
+        self.progress_bar.setRange(0, max(len(self.filtered_results), 1))
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.status_label.setText(f"Exporting to {filename}...")
+
+        # Snapshot the filtered view here on the GUI thread; the debounced
+        # filter/sort handlers keep firing during the export and swap these
+        # attributes, so the worker gets its own stable references
+        snapshot = (self.columns, self.filtered_idx, self.filtered_results)
+        self._export_worker = ExportWorker(fn, filename, snapshot, self)
+        self._export_worker.progress.connect(self.progress_bar.setValue)
+        self._export_worker.finished_ok.connect(self._on_export_finished)
+        self._export_worker.error.connect(self._on_export_error)
+        self._export_worker.start()
+
+    def _on_export_finished(self, filename):
+        self.progress_bar.setVisible(False)
+        self.status_label.setText("Ready")
+        QMessageBox.information(self, "Export Complete", f"Results exported to {filename}")
+
+    def _on_export_error(self, message):
+        self.progress_bar.setVisible(False)
+        self.status_label.setText("Ready")
+        QMessageBox.critical(self, "Export Error", f"Export failed: {message}")
+
+    def _write_csv(self, filename, cols, idx, results, progress_cb=None):
+        """Write a results snapshot as CSV; runs on the export worker thread"""
         def _csv_safe(v):
             s = str(v) if v is not None else ''
             if s and s[0] in ('=', '+', '-', '@', '\t', '\r'):
                 return "'" + s
             return s
 
-        def _fmt_addr(v):
-            try:
-                return f"0x{int(v):016x}"
-            except (TypeError, ValueError):
-                return str(v)
+        # Large buffer so the csv writer hits the kernel in big batches
+        # instead of one syscall per handful of rows
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+
+            # Write header
+            writer.writerow([
+                'Function A', 'Address A', 'Function B', 'Address B',
+                'Similarity', 'Confidence', 'Match Type', 'Size A', 'Size B',
+                'BB Count A', 'BB Count B', 'Instr Count A', 'Instr Count B'
+            ])
+
+            # Feed writerows from a generator over the columnar cache; the
+            # C-level writer amortizes per-row call overhead, and islice
+            # chunks give progress updates without materializing all rows
+            addr16_a = cols.addr16_a()
+            addr16_b = cols.addr16_b()
+
+            def row_iter():
+                for i in idx:
+                    yield (
+                        _csv_safe(cols.names_a[i]),
+                        addr16_a[i],
+                        _csv_safe(cols.names_b[i]),
+                        addr16_b[i],
+                        cols.fmt_sim[i],
+                        cols.fmt_conf[i],
+                        _csv_safe(cols.match_types[i]),
+                        cols.size_a[i],
+                        cols.size_b[i],
+                        cols.bb_count_a[i],
+                        cols.bb_count_b[i],
+                        cols.instr_count_a[i],
+                        cols.instr_count_b[i],
+                    )
+
+            rows = row_iter()
+            written = 0
+            while True:
+                chunk = list(islice(rows, 1000))
+                if not chunk:
+                    break
+                writer.writerows(chunk)
+                written += len(chunk)
+                if progress_cb:
+                    progress_cb(written)
 
-        try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-
-                # Write header
-                writer.writerow([
-                    'Function A', 'Address A', 'Function B', 'Address B',
-                    'Similarity', 'Confidence', 'Match Type', 'Size A', 'Size B',
-                    'BB Count A', 'BB Count B', 'Instr Count A', 'Instr Count B'
-                ])
-
-                # Write data
-                for result in self.filtered_results:
-                    func_a = result.get('function_a', {})
-                    func_b = result.get('function_b', {})
-
-                    writer.writerow([
-                        _csv_safe(func_a.get('name', '')),
-                        _fmt_addr(func_a.get('address', 0)),
-                        _csv_safe(func_b.get('name', '')),
-                        _fmt_addr(func_b.get('address', 0)),
-                        f"{result.get('similarity', 0):.4f}",
-                        f"{result.get('confidence', 0):.4f}",
-                        _csv_safe(result.get('match_type', '')),
-                        func_a.get('size', 0),
-                        func_b.get('size', 0),
-                        len(func_a.get('basic_blocks', [])),
-                        len(func_b.get('basic_blocks', [])),
-                        len(func_a.get('instructions', [])),
-                        len(func_b.get('instructions', []))
-                    ])
-
-            QMessageBox.information(self, "Export Complete", f"Results exported to {filename}")
+            _drop_file_cache(csvfile)
 
-        except (OSError, ValueError, TypeError) as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export CSV: {str(e)}")
+    def export_to_parquet(self):
+        """Export filtered results to Parquet (requires pyarrow)"""
+        filename, _ = QFileDialog.getSaveFileName(self, "Export to Parquet", "", "Parquet Files (*.parquet)")
+        if not filename:
+            return
+
+        self._start_export(self._write_parquet, filename)
+
+    def _write_parquet(self, filename, cols, idx, results, progress_cb=None):
+        """Write a results snapshot as Parquet; runs on the export worker thread"""
+        # Numeric columns fancy-index straight out of the SoA arrays with
+        # no per-row Python objects; zstd keeps the file compact
+        table = pa.table({
+            'function_a_name': [cols.names_a[i] for i in idx],
+            'function_a_address': cols.addr_a[idx],
+            'function_b_name': [cols.names_b[i] for i in idx],
+            'function_b_address': cols.addr_b[idx],
+            'similarity': cols.similarity[idx],
+            'confidence': cols.confidence[idx],
+            'match_type': [cols.match_types[i] for i in idx],
+            'size_a': cols.size_a[idx],
+            'size_b': cols.size_b[idx],
+            'bb_count_a': cols.bb_count_a[idx],
+            'bb_count_b': cols.bb_count_b[idx],
+            'instr_count_a': cols.instr_count_a[idx],
+            'instr_count_b': cols.instr_count_b[idx],
+        })
+        pq.write_table(table, filename, compression='zstd')
+
+        if progress_cb:
+            progress_cb(len(idx))
 
     def export_to_sqlite(self):
         """Export filtered results to SQLite database"""
@@ -1490,14 +1838,74 @@ class DiffResultsWindow(QMainWindow):
         if not filename:
             return
 
+        self._start_export(self._write_sqlite, filename)
+
+    def _flat_export_rows(self, cols, idx):
+        """Flatten a results snapshot into export tuples, built lazily.
+
+        The numpy-to-Python conversions and address formatting happen once
+        per filter/sort state; repeat exports of the same view reuse the
+        cached list. The cache is keyed by the snapshot objects' identity,
+        so a snapshot from a changed view never matches a stale entry.
+        """
+        cached = self._flat_rows
+        if cached is not None and cached[0] is cols and cached[1] is idx:
+            return cached[2]
+
+        addr16_a = cols.addr16_a()
+        addr16_b = cols.addr16_b()
+        rows = [
+                (
+                    cols.names_a[i],
+                    addr16_a[i],
+                    cols.names_b[i],
+                    addr16_b[i],
+                    float(cols.similarity[i]),
+                    float(cols.confidence[i]),
+                    cols.match_types[i],
+                    int(cols.size_a[i]),
+                    int(cols.size_b[i]),
+                    int(cols.bb_count_a[i]),
+                    int(cols.bb_count_b[i]),
+                    int(cols.instr_count_a[i]),
+                    int(cols.instr_count_b[i]),
+                )
+                for i in idx
+            ]
+        self._flat_rows = (cols, idx, rows)
+        return rows
+
+    def _match_index(self):
+        """Lazy (addr_a, addr_b) -> result lookup over the filtered set"""
+        if self._match_idx is None:
+            self._match_idx = {
+                (r.get('function_a', {}).get('address', 0),
+                 r.get('function_b', {}).get('address', 0)): r
+                for r in self.filtered_results
+            }
+        return self._match_idx
+
+    def _write_sqlite(self, filename, cols, idx, results, progress_cb=None):
+        """Write a results snapshot to SQLite; runs on the export worker thread"""
+        conn = sqlite3.connect(filename, cached_statements=256)
         try:
-            conn = sqlite3.connect(filename)
+            # Bulk-load settings: WAL avoids the rollback journal's double
+            # write, NORMAL drops the per-commit fsync, spills stay in
+            # memory, and a 64 MiB page cache amortizes page writes. All
+            # safe for an export database that can simply be regenerated.
+            # Any future CREATE INDEX belongs after the bulk insert below.
+            conn.executescript(
+                "PRAGMA journal_mode=WAL;"
+                "PRAGMA synchronous=NORMAL;"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA cache_size=-65536;"
+            )
             cursor = conn.cursor()
 
             # Create table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS function_matches (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     function_a_name TEXT,
                     function_a_address TEXT,
                     function_b_name TEXT,
@@ -1515,71 +1923,66 @@ class DiffResultsWindow(QMainWindow):
                 )
             ''')
 
-            def _fmt_addr(v):
-                try:
-                    return f"0x{int(v):016x}"
-                except (TypeError, ValueError):
-                    return str(v)
-
-            # Insert data
-            for result in self.filtered_results:
-                func_a = result.get('function_a', {})
-                func_b = result.get('function_b', {})
-
-                cursor.execute('''
-                    INSERT INTO function_matches
-                    (function_a_name, function_a_address, function_b_name, function_b_address,
-                     similarity, confidence, match_type, size_a, size_b, bb_count_a, bb_count_b,
-                     instr_count_a, instr_count_b)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    func_a.get('name', ''),
-                    _fmt_addr(func_a.get('address', 0)),
-                    func_b.get('name', ''),
-                    _fmt_addr(func_b.get('address', 0)),
-                    result.get('similarity', 0),
-                    result.get('confidence', 0),
-                    result.get('match_type', ''),
-                    func_a.get('size', 0),
-                    func_b.get('size', 0),
-                    len(func_a.get('basic_blocks', [])),
-                    len(func_b.get('basic_blocks', [])),
-                    len(func_a.get('instructions', [])),
-                    len(func_b.get('instructions', []))
-                ))
-
-            conn.commit()
+            # executemany inside explicit transactions amortizes the
+            # per-statement journal/fsync cost; batching the transactions
+            # keeps each one inside the page cache on very large exports
+            rows = self._flat_export_rows(cols, idx)
+
+            for start in range(0, len(rows), _SQLITE_BATCH_SIZE):
+                conn.execute("BEGIN")
+                cursor.executemany(_INSERT_MATCH_SQL, rows[start:start + _SQLITE_BATCH_SIZE])
+                conn.commit()
+                if progress_cb:
+                    progress_cb(min(start + _SQLITE_BATCH_SIZE, len(rows)))
+
+            if progress_cb:
+                progress_cb(len(idx))
+        finally:
             conn.close()
 
-            QMessageBox.information(self, "Export Complete", f"Results exported to {filename}")
-
-        except (OSError, sqlite3.Error, ValueError, TypeError) as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export SQLite: {str(e)}")
-
     def export_to_json(self):
         """Export filtered results to JSON"""
         filename, _ = QFileDialog.getSaveFileName(self, "Export to JSON", "", "JSON Files (*.json)")
         if not filename:
             return
 
-        try:
-            export_data = {
-                'metadata': {
-                    'export_time': datetime.now().isoformat(),
-                    'total_results': len(self.filtered_results),
-                    'binary_a': self.results_data.get('binary_a_name', ''),
-                    'binary_b': self.results_data.get('binary_b_name', ''),
-                },
-                'results': self.filtered_results
-            }
-
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+        self._start_export(self._write_json, filename)
 
-            QMessageBox.information(self, "Export Complete", f"Results exported to {filename}")
+    def _write_json(self, filename, cols, idx, results, progress_cb=None):
+        """Stream a results snapshot to JSON; runs on the export worker thread"""
+        metadata = {
+            'export_time': datetime.now().isoformat(),
+            'total_results': len(results),
+            'binary_a': self.results_data.get('binary_a_name', ''),
+            'binary_b': self.results_data.get('binary_b_name', ''),
+        }
 
-        except (OSError, ValueError, TypeError) as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export JSON: {str(e)}")
+        if orjson is not None:
+            encode = orjson.dumps
+        else:
+            def encode(obj):
+                return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+        # Emit the document incrementally - metadata first, then one
+        # compact encoder call per result - so peak memory stays flat
+        # instead of holding the serialized string for the whole set.
+        # Binary mode takes the encoder's UTF-8 bytes straight into the
+        # write buffer with no text-layer re-encode.
+        with open(filename, 'wb', buffering=1 << 20) as f:
+            f.write(b'{"metadata":')
+            f.write(encode(metadata))
+            f.write(b',"results":[')
+            for row_num, result in enumerate(results, 1):
+                if row_num > 1:
+                    f.write(b',')
+                f.write(encode(result))
+                if progress_cb and row_num % 1000 == 0:
+                    progress_cb(row_num)
+            f.write(b']}')
+            _drop_file_cache(f)
+
+        if progress_cb:
+            progress_cb(len(results))
 
     def export_to_html(self):
         """Export filtered results to HTML"""
@@ -1587,15 +1990,23 @@ class DiffResultsWindow(QMainWindow):
         if not filename:
             return
 
-        try:
-            html_content = self.generate_html_report()
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-
-            QMessageBox.information(self, "Export Complete", f"Results exported to {filename}")
-
-        except (OSError, ValueError, TypeError) as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export HTML: {str(e)}")
+        self._start_export(self._write_html, filename)
+
+    def _write_html(self, filename, cols, idx, results, progress_cb=None):
+        """Stream a results snapshot as HTML; runs on the export worker thread"""
+        # Header, one write per row from the generator, then footer: the
+        # report never exists as one in-memory string, and the 1 MiB buffer
+        # batches the small row writes into large syscalls
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(self.generate_html_header(len(results)))
+            for row_num, row in enumerate(self.iter_html_table_rows(cols, idx), 1):
+                f.write(row)
+                if progress_cb and row_num % 1000 == 0:
+                    progress_cb(row_num)
+            f.write(self.generate_html_footer())
+            _drop_file_cache(f)
+        if progress_cb:
+            progress_cb(len(idx))
 
     def export_current_diff_to_json(self):
         """Export the current diff view to JSON"""
@@ -1621,12 +2032,14 @@ class DiffResultsWindow(QMainWindow):
             text_a = self.diff_tab._get_function_text(
                 self.diff_tab.current_function_a,
                 view_mode,
-                self.diff_tab.binary_view_a
+                self.diff_tab.binary_view_a,
+                self.diff_tab._func_a
             )
             text_b = self.diff_tab._get_function_text(
                 self.diff_tab.current_function_b,
                 view_mode,
-                self.diff_tab.binary_view_b
+                self.diff_tab.binary_view_b,
+                self.diff_tab._func_b
             )
 
             # Find the match result for these functions (if available)
@@ -1634,15 +2047,13 @@ class DiffResultsWindow(QMainWindow):
             func_a_addr = self.diff_tab.current_function_a.get('address', 0)
             func_b_addr = self.diff_tab.current_function_b.get('address', 0)
 
-            for result in self.filtered_results:
-                if (result.get('function_a', {}).get('address') == func_a_addr and
-                    result.get('function_b', {}).get('address') == func_b_addr):
-                    match_info = {
-                        'similarity': result.get('similarity', 0),
-                        'confidence': result.get('confidence', 0),
-                        'match_type': result.get('match_type', 'Unknown')
-                    }
-                    break
+            result = self._match_index().get((func_a_addr, func_b_addr))
+            if result is not None:
+                match_info = {
+                    'similarity': result.get('similarity', 0),
+                    'confidence': result.get('confidence', 0),
+                    'match_type': result.get('match_type', 'Unknown')
+                }
 
             # Create export data
             export_data = {
@@ -1675,9 +2086,12 @@ class DiffResultsWindow(QMainWindow):
             if match_info:
                 export_data['match_info'] = match_info
 
-            # Write to file
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            # Write to file; one encoder call, orjson when available
+            with open(filename, 'wb') as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+                else:
+                    f.write(json.dumps(export_data, indent=2, ensure_ascii=False).encode('utf-8'))
 
             QMessageBox.information(self, "Export Complete", f"Current diff view exported to {filename}")
 
@@ -1686,88 +2100,59 @@ class DiffResultsWindow(QMainWindow):
 
     def generate_html_report(self):
         """Generate HTML report of results"""
-        report = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Binary Diff Results</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .header {{ background-color: #f0f0f0; padding: 20px; margin-bottom: 20px; }}
-        .summary {{ background-color: #e8f4f8; padding: 15px; margin-bottom: 20px; }}
-        table {{ border-collapse: collapse; width: 100%; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #4CAF50; color: white; }}
-        tr:nth-child(even) {{ background-color: #f2f2f2; }}
-        .high-confidence {{ background-color: #90EE90; color: #006400; }}
-        .medium-confidence {{ background-color: #FFD700; color: #8B4513; }}
-        .low-confidence {{ background-color: #FFB6C1; color: #8B0000; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>Binary Diff Results</h1>
-        <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-    </div>
+        return self.generate_html_header() + self.generate_html_table_rows() + self.generate_html_footer()
+
+    def generate_html_header(self, result_count=None):
+        """Generate everything up to and including the table header row"""
+        if result_count is None:
+            result_count = len(self.filtered_results)
+        return _HTML_HEAD % (
+            datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            html.escape(str(self.results_data.get('binary_a_name', 'N/A'))),
+            html.escape(str(self.results_data.get('binary_b_name', 'N/A'))),
+            result_count,
+            self.results_data.get('analysis_time', 0),
+        )
 
-    <div class="summary">
-        <h2>Summary</h2>
-        <p><strong>Binary A:</strong> {html.escape(str(self.results_data.get('binary_a_name', 'N/A')))}</p>
-        <p><strong>Binary B:</strong> {html.escape(str(self.results_data.get('binary_b_name', 'N/A')))}</p>
-        <p><strong>Total Matches:</strong> {len(self.filtered_results)}</p>
-        <p><strong>Analysis Time:</strong> {self.results_data.get('analysis_time', 0):.2f} seconds</p>
-    </div>
+    def generate_html_footer(self):
+        """Generate the closing tags after the table rows"""
+        return _HTML_FOOT
+
+    def iter_html_table_rows(self, cols=None, idx=None):
+        """Yield HTML table rows one at a time from a columnar snapshot"""
+        if cols is None:
+            cols = self.columns
+        if idx is None:
+            idx = self.filtered_idx
+        escape = html.escape
+        addr16_a = cols.addr16_a()
+        addr16_b = cols.addr16_b()
+        esc_names_a = cols.esc_names_a()
+        esc_names_b = cols.esc_names_b()
+
+        # Confidence banding vectorized up front; the loop body is then
+        # pure template substitution over pre-formatted strings
+        conf = cols.confidence[idx]
+        css_classes = np.where(
+            conf >= 0.67, 'high-confidence',
+            np.where(conf >= 0.34, 'medium-confidence', 'low-confidence')
+        )
 
-    <table>
-        <tr>
-            <th>Function A</th>
-            <th>Address A</th>
-            <th>Function B</th>
-            <th>Address B</th>
-            <th>Similarity</th>
-            <th>Confidence</th>
-            <th>Match Type</th>
-        </tr>
-        {self.generate_html_table_rows()}
-    </table>
-</body>
-</html>
-        """
-        return report
+        for pos, i in enumerate(idx):
+            yield _HTML_ROW % (
+                css_classes[pos],
+                esc_names_a[i],
+                addr16_a[i],
+                esc_names_b[i],
+                addr16_b[i],
+                cols.fmt_sim[i],
+                cols.fmt_conf[i],
+                escape(cols.match_types[i]),
+            )
 
     def generate_html_table_rows(self):
         """Generate HTML table rows for results"""
-        def _fmt_addr(v):
-            try:
-                return f"0x{int(v):016x}"
-            except (TypeError, ValueError):
-                return html.escape(str(v))
-
-        parts = []
-        for result in self.filtered_results:
-            func_a = result.get('function_a', {})
-            func_b = result.get('function_b', {})
-            confidence = result.get('confidence', 0)
-
-            if confidence >= 0.67:
-                css_class = 'high-confidence'
-            elif confidence >= 0.34:
-                css_class = 'medium-confidence'
-            else:
-                css_class = 'low-confidence'
-
-            parts.append(
-                f'<tr class="{css_class}">'
-                f'<td>{html.escape(str(func_a.get("name", "")))}</td>'
-                f'<td>{_fmt_addr(func_a.get("address", 0))}</td>'
-                f'<td>{html.escape(str(func_b.get("name", "")))}</td>'
-                f'<td>{_fmt_addr(func_b.get("address", 0))}</td>'
-                f'<td>{result.get("similarity", 0):.4f}</td>'
-                f'<td>{result.get("confidence", 0):.4f}</td>'
-                f'<td>{html.escape(str(result.get("match_type", "")))}</td>'
-                f'</tr>\n'
-            )
-        return ''.join(parts)
+        return ''.join(self.iter_html_table_rows())
 
 
 def show_diff_results(results_data, binary_view_a=None, binary_view_b=None):
@@ -3,16 +3,28 @@
 Helper script to install PySide6 in Binary Ninja's Python environment
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
 
+# Wheels only (never build Qt from source) and skip pip's version
+# self-check, update probe, and interactive prompts
+PIP_INSTALL_ARGS = [
+    "install",
+    "--only-binary=:all:",
+    "--prefer-binary",
+    "--disable-pip-version-check",
+    "--no-python-version-warning",
+    "--no-input",
+]
+
 def install_pyside():
     """Install PySide6 using pip"""
     try:
         # Try to install PySide6
         print("Installing PySide6...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "PySide6"])
+        subprocess.check_call([sys.executable, "-m", "pip"] + PIP_INSTALL_ARGS + ["PySide6"])
         print("PySide6 installed successfully!")
         
         # Test import
@@ -30,7 +42,7 @@ def install_pyside():
         # Try PySide2 as fallback
         try:
             print("Trying PySide2 as fallback...")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "PySide2"])
+            subprocess.check_call([sys.executable, "-m", "pip"] + PIP_INSTALL_ARGS + ["PySide2"])
             print("PySide2 installed successfully!")
             
             # Test import
@@ -47,20 +59,16 @@ def install_pyside():
 
 def check_installation():
     """Check if PySide6 or PySide2 is available"""
-    try:
-        import PySide6.QtWidgets
+    # find_spec checks availability without dlopen'ing the Qt libraries;
+    # install_pyside() still does a real import to verify after installing
+    if importlib.util.find_spec("PySide6") is not None:
         print("PySide6 is available!")
         return True
-    except ImportError:
-        pass
-    
-    try:
-        import PySide2.QtWidgets
+
+    if importlib.util.find_spec("PySide2") is not None:
         print("PySide2 is available!")
         return True
-    except ImportError:
-        pass
-    
+
     print("Neither PySide6 nor PySide2 is available.")
     return False
 